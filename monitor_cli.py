@@ -0,0 +1,35 @@
+"""Runs the Twickets monitor headless, outside Streamlit (e.g. as a systemd service).
+
+The Streamlit app reads the same monitor_status.json and subscriber files, so it can be left
+running purely as the UI while this process does the polling.
+"""
+import logging
+import os
+import signal
+
+from oasis_py import TwicketsMonitor
+
+
+def main():
+    monitor = TwicketsMonitor(
+        url=os.environ["TWICKETS_URL"],
+        sender_email=os.environ["SENDER_EMAIL"],
+        sender_password=os.environ["SENDER_PASSWORD"],
+        admin_email=os.environ.get("ADMIN_EMAIL"),
+        first_dibs_delay=int(os.environ.get("FIRST_DIBS_DELAY", 90)),
+        smtp_port=int(os.environ.get("SMTP_PORT", 587)),
+        smtp_workers=int(os.environ.get("SMTP_CONCURRENCY", 4)),
+        bcc_mode=os.environ.get("SMTP_BCC_MODE", "").lower() in ("1", "true", "yes")
+    )
+    signal.signal(signal.SIGTERM, lambda *_: monitor.stop())
+    signal.signal(signal.SIGINT, lambda *_: monitor.stop())
+    first_dibs = os.environ.get("FIRST_DIBS", "").lower() in ("1", "true", "yes")
+    logging.info("Starting headless monitor.")
+    try:
+        monitor.monitor_loop(int(os.environ.get("CHECK_INTERVAL", 30)), first_dibs)
+    finally:
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import streamlit as st
 import pandas as pd
-import json
+import orjson
 import os
 import threading
 import time
@@ -11,91 +11,291 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import hashlib
 import re
+import functools
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 
 # Selenium Imports
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
+from webdriver_manager.core.driver_cache import DriverCacheManager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # File paths
 USERS_FILE = 'subscribers.json'
+SUBSCRIBERS_LOG = 'subscribers.log.jsonl'
 STATUS_FILE = 'monitor_status.json'
+IO_BUFFER_SIZE = 64 * 1024
+RECIPIENT_PLACEHOLDER = '__OASIS_RECIPIENT__'
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+SMTP_ABORT_MIN_BATCH = 30
+SMTP_TRANSIENT_CODES = {421, 450, 451, 452, 454}
+SMTP_RETRY_ATTEMPTS = 3
+SMTP_MAX_SENDS_PER_SECOND = 10
+SMTP_BCC_BATCH = 100
+SMTP_TIMEOUT = 15
+PAGE_READY_TIMEOUT = 10
+DRIVER_RECYCLE_CHECKS = 240
+DRIVER_CACHE_VALID_DAYS = 7
+SCRAPE_CACHE_TTL = 5
+JOB_DRIVER_IDLE_SECONDS = 300
+STATUS_FLUSH_SECONDS = 60
 
-@st.cache_resource
-def get_driver():
-    """Sets up and returns a cached Selenium Chrome driver for UI actions."""
+# Reads the no-listings banner and every listing's seat/summary text in a single WebDriver round trip
+SCRAPE_LISTINGS_JS = """
+var banner = document.getElementById('no-listings-found');
+return {
+    banner: banner ? (banner.getAttribute('style') || '') : null,
+    listings: Array.from(document.querySelectorAll('ul#list twickets-listing')).map(function (listing) {
+        var details = listing.querySelector('span[id^="listingSeatDetails"]');
+        var summary = listing.querySelector('span[id^="listingTicketSummary"]');
+        return details && summary ? [details.innerText.trim(), summary.innerText.trim()] : null;
+    })
+};
+"""
+
+# True once the no-listings banner is showing, or every listing has its seat details rendered
+LISTINGS_READY_JS = """
+var banner = document.getElementById('no-listings-found');
+if (banner && getComputedStyle(banner).display !== 'none') return true;
+var listings = document.querySelectorAll('ul#list twickets-listing');
+return listings.length > 0 && Array.prototype.every.call(listings, function (listing) {
+    var details = listing.querySelector('span[id^="listingSeatDetails"]');
+    return !!(details && details.innerText.trim());
+});
+"""
+
+_DISPLAY_NONE_RE = re.compile(r'display\s*:\s*none', re.I)
+_PRICE_RE = re.compile(r'£\s?[\d,.]+')
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}$")
+
+# Requests the listing DOM never needs; blocked at the network layer so each poll only pays for HTML + app JS
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*",
+]
+
+def ticket_id(details_text):
+    """64-bit integer fingerprint of a listing's seat details, used as its dedup key."""
+    return int.from_bytes(hashlib.blake2b(details_text.encode(), digest_size=8).digest(), 'big')
+
+def atomic_write(path, data):
+    """Writes bytes to a temp file and renames it over path, so readers never see a partial file."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        f.write(data)
+        f.flush()
+        # Without this a power loss can leave the renamed file empty on filesystems that reorder metadata.
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def file_version(path):
+    """Returns (mtime_ns, size) for path, or None if it doesn't exist; a cheap change check that skips reading."""
+    try: stat = os.stat(path)
+    except FileNotFoundError: return None
+    return stat.st_mtime_ns, stat.st_size
+
+def quit_quietly(client):
+    try: client.quit()
+    except Exception: pass
+
+def chrome_options():
+    """Builds the headless Chrome options shared by every driver."""
     options = Options()
+    # check_tickets waits for the listings explicitly, so navigation needn't block on every subresource.
+    options.page_load_strategy = "eager"
     options.add_argument("--disable-gpu")
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--window-size=800,600")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--metrics-recording-only")
+    options.add_argument("--mute-audio")
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36")
-    service = Service(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install())
-    return webdriver.Chrome(service=service, options=options)
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+CHROME_OPTIONS = chrome_options()
+
+@functools.lru_cache(maxsize=1)
+def chromedriver_path():
+    """Resolves the chromedriver binary once per process; install() otherwise re-checks for updates on every call."""
+    # Trust the on-disk driver for a week, so cold boots skip the version lookup too.
+    cache = DriverCacheManager(valid_range=DRIVER_CACHE_VALID_DAYS)
+    return ChromeDriverManager(chrome_type=ChromeType.CHROMIUM, cache_manager=cache).install()
+
+def create_driver():
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=CHROME_OPTIONS)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        logging.warning(f"Could not enable request blocking: {e.msg}")
+    return driver
+
+
+@st.cache_data(max_entries=4)
+def read_status(path, mtime):
+    """Parses the status file; cached per mtime so reruns only re-read it after the monitor writes."""
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return orjson.loads(f.read())
 
 
 class TwicketsMonitor:
-    def __init__(self, url, sender_email, sender_password, admin_email=None, first_dibs_delay=90, smtp_server="smtp.gmail.com", smtp_port=587):
+    def __init__(self, url, sender_email, sender_password, admin_email=None, first_dibs_delay=90, smtp_server="smtp.gmail.com", smtp_port=587, smtp_workers=4, bcc_mode=False):
         self.url = url
         self.sender_email = sender_email
         self.sender_password = sender_password
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
-        self.admin_email = admin_email
+        self.smtp_workers = max(1, smtp_workers)
+        self.bcc_mode = bcc_mode
+        self._smtp, self._smtp_sent = None, 0
+        self._smtp_lock = threading.Lock()
+        self._next_send_at, self._rate_lock = 0.0, threading.Lock()
+        # Single job worker: it owns its own driver (_job_driver), which can only serve one page at a time.
+        self._jobs = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oasis-jobs")
+        self._job_driver, self._job_driver_used_at = None, 0.0
+        # Alert emails are sent here, off the monitor loop; first-dibs delays are timers, so they never hold the worker.
+        self._broadcasts = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oasis-broadcast")
+        self._pending_broadcasts, self._broadcast_lock = set(), threading.Lock()
+        self.admin_email = admin_email.lower().strip() if admin_email else admin_email
         self.first_dibs_delay = first_dibs_delay
         self.known_tickets = set()
+        self._known_lock = threading.Lock()
         self.is_running = False
-        self.subscribers = self.load_subscribers()
+        self._stop_event = threading.Event()
+        self._run_lock = threading.Lock()
+        self._thread = None
+        self.driver = None
+        self._status = None
+        self._last_status_bytes = None
+        self._last_scrape, self._last_scrape_ts = None, 0.0
+        self._scrape_ttl = SCRAPE_CACHE_TTL
+        self._scrape_lock = threading.Lock()
+        self._id_cache = {}
+        # Bumped after every subscriber change; broadcast_recipients' cache is only valid for the generation it was built from.
+        self._subscribers_gen, self._recipients = 0, None
+        # Session threads add/remove while the broadcast worker reloads; re-entrant because changes may compact.
+        self._subscribers_lock = threading.RLock()
+        self.subscribers = self._load_subscribers()
+
+    def _subscriber_files_version(self):
+        return file_version(USERS_FILE), file_version(SUBSCRIBERS_LOG)
 
-    def load_subscribers(self):
+    def _load_subscribers(self):
+        """Loads the subscriber snapshot and replays the append-only log over it, indexed by email."""
+        subscribers, self._log_entries = {}, 0
+        self._subscribers_version = self._subscriber_files_version()
         try:
             if os.path.exists(USERS_FILE):
-                with open(USERS_FILE, 'r') as f: return json.load(f)
-            return []
+                with open(USERS_FILE, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    for s in orjson.loads(f.read()):
+                        s['email'] = s['email'].lower().strip()
+                        subscribers[s['email']] = s
+            if os.path.exists(SUBSCRIBERS_LOG):
+                with open(SUBSCRIBERS_LOG, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    for line in f:
+                        try: entry = orjson.loads(line)
+                        except orjson.JSONDecodeError: continue
+                        if entry['op'] == 'add':
+                            entry['subscriber']['email'] = entry['subscriber']['email'].lower().strip()
+                            subscribers[entry['subscriber']['email']] = entry['subscriber']
+                        else: subscribers.pop(entry['email'].lower().strip(), None)
+                        self._log_entries += 1
         except Exception as e:
-            logging.error(f"Error loading subscribers: {e}"); return []
+            logging.error(f"Error loading subscribers: {e}")
+        return subscribers
 
     def save_subscribers(self):
+        """Compacts the log: writes a full snapshot, then truncates the log it supersedes."""
+        with self._subscribers_lock:
+            try:
+                atomic_write(USERS_FILE, orjson.dumps(list(self.subscribers.values())))
+                open(SUBSCRIBERS_LOG, 'wb').close()
+                self._log_entries = 0
+                self._subscribers_version = self._subscriber_files_version()
+            except Exception as e:
+                logging.error(f"Error saving subscribers: {e}")
+
+    def _log_subscriber_change(self, entry):
+        """Appends a change to the log, compacting when due; caller holds _subscribers_lock."""
+        self._subscribers_gen += 1
         try:
-            with open(USERS_FILE, 'w') as f: json.dump(self.subscribers, f, indent=2)
+            with open(SUBSCRIBERS_LOG, 'ab') as f: f.write(orjson.dumps(entry) + b"\n")
+            self._log_entries += 1
+            self._subscribers_version = self._subscriber_files_version()
         except Exception as e:
-            logging.error(f"Error saving subscribers: {e}")
+            logging.error(f"Error appending to subscriber log: {e}")
+        if self._log_entries > 2 * len(self.subscribers): self.save_subscribers()
+
+    def broadcast_recipients(self, exclude_admin):
+        """Subscriber emails as a tuple, cached until the next add, remove or reload."""
+        cached, gen = self._recipients, self._subscribers_gen
+        if cached is None or cached[0] != gen:
+            # Runs on the broadcast thread while the UI may add subscribers; an add mid-build bumps the
+            # generation, so the tuple built here is tagged stale and rebuilt on the next call.
+            emails = tuple(self.subscribers)
+            cached = self._recipients = (gen, emails, tuple(e for e in emails if e != self.admin_email))
+        return cached[2 if exclude_admin else 1]
+
+    def refresh_subscribers(self):
+        """Reloads subscribers only if another process has changed the files since this one last read or wrote them."""
+        with self._subscribers_lock:
+            if self._subscriber_files_version() != self._subscribers_version:
+                self.subscribers = self._load_subscribers()
+                self._subscribers_gen += 1
     
     # --- METHOD RESTORED ---
     def get_status(self):
+        # Once this process's thread has exited, its final status is on disk alongside any external poller's.
+        if self._status is not None and self.polls_in_process():
+            return dict(self._status)
         try:
             if os.path.exists(STATUS_FILE):
-                with open(STATUS_FILE, 'r') as f:
-                    return json.load(f)
+                return read_status(STATUS_FILE, os.path.getmtime(STATUS_FILE))
             return {'is_running': False, 'last_check': None, 'total_checks': 0, 'tickets_found': 0}
         except Exception as e:
             logging.error(f"Error getting status: {e}")
             return {'is_running': False, 'last_check': None, 'total_checks': 0, 'tickets_found': 0}
 
+    def polls_in_process(self):
+        """Whether this process's monitor thread is (still) running, as opposed to a poller in another process."""
+        return self._thread is not None and self._thread.is_alive()
+
     # --- METHOD RESTORED ---
     def get_subscriber_count(self):
         return len(self.subscribers)
 
     def add_subscriber(self, email, name=""):
         email = email.lower().strip()
-        if any(s['email'] == email for s in self.subscribers):
-            return False, "Email already subscribed"
-        self.subscribers.append({'email': email, 'name': name, 'subscribed_at': datetime.now().isoformat()})
-        self.save_subscribers()
-        self.notify_new_subscriber_of_current_tickets(email, name)
+        if '@' not in email or len(email) > 254 or not _EMAIL_RE.match(email):
+            return False, "Please enter a valid email address"
+        with self._subscribers_lock:
+            if email in self.subscribers:
+                return False, "Email already subscribed"
+            self.subscribers[email] = {'email': email, 'name': name, 'subscribed_at': datetime.now().isoformat()}
+            self._log_subscriber_change({'op': 'add', 'subscriber': self.subscribers[email]})
+        self.submit_job(self.notify_new_subscriber_of_current_tickets, email, name)
         return True, "Successfully subscribed!"
 
     def notify_new_subscriber_of_current_tickets(self, email, name):
         try:
-            driver = get_driver()
-            current_tickets = self.check_tickets(driver=driver, is_one_off_check=True)
+            current_tickets = self.current_tickets()
             if current_tickets:
                 self.send_welcome_email_with_current_tickets(email, name, current_tickets)
             else:
@@ -103,21 +303,149 @@ class TwicketsMonitor:
         except Exception as e:
             logging.error(f"Error during one-off check for new subscriber: {e}")
 
+    def _smtp_connect(self):
+        # Port 465 is implicit TLS: one handshake instead of a plaintext EHLO followed by STARTTLS.
+        if self.smtp_port == 465:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
+            server.starttls()
+        server.login(self.sender_email, self.sender_password)
+        return server
+
+    def _build_message(self, recipient, subject, body):
+        msg = MIMEMultipart()
+        msg['From'] = self.sender_email
+        msg['To'] = recipient
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+
+    def _close_smtp(self):
+        if self._smtp: quit_quietly(self._smtp)
+        self._smtp, self._smtp_sent = None, 0
+
+    def _get_smtp(self):
+        """Returns the cached SMTP session for one-off emails, recycling it once it has carried enough messages."""
+        if self._smtp is not None and self._smtp_sent >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+            self._close_smtp()
+        if self._smtp is None:
+            self._smtp, self._smtp_sent = self._smtp_connect(), 0
+        return self._smtp
+
+    def _sendmail_cached(self, recipients, raw):
+        """Sends over the cached session (caller holds _smtp_lock); returns sendmail's refused dict."""
+        server = self._get_smtp()
+        reused = self._smtp_sent > 0
+        try:
+            refused = server.sendmail(self.sender_email, recipients, raw)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+            # One-off mail is rare, so a reused session has usually idled out: the server drops the link or
+            # answers 421 before closing. Only that gets a retry; other refusals are real, and resending after
+            # an accepted DATA could deliver twice.
+            stale = isinstance(e, smtplib.SMTPServerDisconnected) or e.smtp_code == 421
+            if not (reused and stale): raise
+            self._close_smtp()
+            refused = self._get_smtp().sendmail(self.sender_email, recipients, raw)
+        self._smtp_sent += 1
+        return refused
+
     def send_email(self, recipient, subject, body):
+        raw = self._build_message(recipient, subject, body).as_string()
+        with self._smtp_lock:
+            try:
+                self._sendmail_cached(recipient, raw)
+                logging.info(f"Email sent successfully to {recipient}")
+            except Exception as e:
+                self._close_smtp()
+                logging.error(f"Failed to send email to {recipient}: {e}")
+
+    def _throttle(self):
+        """Spaces sends from all shard workers evenly, at most SMTP_MAX_SENDS_PER_SECOND in total."""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_send_at)
+            self._next_send_at = slot + 1 / SMTP_MAX_SENDS_PER_SECOND
+        if slot > now: time.sleep(slot - now)
+
+    def _send_shard(self, recipients, template):
+        """Sends a pre-rendered message to every recipient over a single SMTP session; returns the number sent."""
+        sent, failed, on_connection, server = 0, 0, 0, None
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = recipient
-            msg['Subject'] = subject
-            msg.attach(MIMEText(body, 'plain'))
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.sendmail(self.sender_email, recipient, msg.as_string())
-            server.quit()
-            logging.info(f"Email sent successfully to {recipient}")
+            for recipient in recipients:
+                raw = template.replace(RECIPIENT_PLACEHOLDER, recipient, 1)
+                self._throttle()
+                try:
+                    for attempt in range(SMTP_RETRY_ATTEMPTS):
+                        last_attempt = attempt == SMTP_RETRY_ATTEMPTS - 1
+                        try:
+                            if server is not None and on_connection >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+                                quit_quietly(server); server = None
+                            if server is None:
+                                server, on_connection = self._smtp_connect(), 0
+                            server.sendmail(self.sender_email, recipient, raw)
+                            break
+                        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as e:
+                            # Greylisting / rate-limit replies are temporary: back off exponentially and retry.
+                            # They come back at RCPT TO (per recipient) as often as at MAIL FROM / DATA.
+                            if isinstance(e, smtplib.SMTPRecipientsRefused): code = e.recipients[recipient][0]
+                            else: code = e.smtp_code
+                            if code not in SMTP_TRANSIENT_CODES or last_attempt: raise
+                            time.sleep(2 ** attempt)
+                            if code == 421:
+                                if server is not None: quit_quietly(server)
+                                server = None
+                        except (smtplib.SMTPServerDisconnected, OSError):
+                            # SMTPException is an OSError too, so reply codes are handled above first.
+                            # A dropped link or failed (re)connect: the next attempt starts a fresh session.
+                            if server is not None: quit_quietly(server)
+                            server = None
+                            if last_attempt: raise
+                    sent += 1; on_connection += 1
+                    logging.info(f"Email sent successfully to {recipient}")
+                except (smtplib.SMTPException, OSError) as e:
+                    failed += 1
+                    logging.error(f"Failed to send email to {recipient}: {e}")
+                    # A third of a sizeable batch failing means the account or server is refusing us; stop hammering it.
+                    if sent + failed >= SMTP_ABORT_MIN_BATCH and failed * 3 >= sent + failed:
+                        logging.error(f"Aborting bulk email shard after {failed} failures.")
+                        break
         except Exception as e:
-            logging.error(f"Failed to send email to {recipient}: {e}")
+            logging.error(f"Bulk email shard aborted: {e}")
+        finally:
+            if server is not None: quit_quietly(server)
+        return sent
+
+    def _send_bcc(self, recipients, raw):
+        """Sends raw once per SMTP_BCC_BATCH recipients, addressed on the envelope only; returns the number accepted."""
+        sent = 0
+        for i in range(0, len(recipients), SMTP_BCC_BATCH):
+            batch = list(recipients[i:i + SMTP_BCC_BATCH])
+            self._throttle()
+            # Locked per batch, not per broadcast, so welcome and first-dibs emails can slip in between.
+            with self._smtp_lock:
+                try:
+                    sent += len(batch) - len(self._sendmail_cached(batch, raw))
+                except Exception as e:
+                    self._close_smtp()
+                    logging.error(f"Failed to send BCC batch of {len(batch)}: {e}")
+        return sent
+
+    def send_bulk_email(self, recipients, subject, body):
+        if not recipients: return
+        if self.bcc_mode:
+            # Addressed to ourselves with no Bcc header, so subscribers never see each other's addresses.
+            sent = self._send_bcc(recipients, self._build_message(self.sender_email, subject, body).as_string())
+            logging.info(f"Broadcast delivered to {sent}/{len(recipients)} subscribers.")
+            return
+        # Split across up to smtp_workers sessions so SMTP round trips overlap.
+        # Only the To header differs per recipient, so the MIME message is serialised once.
+        template = self._build_message(RECIPIENT_PLACEHOLDER, subject, body).as_string()
+        workers = min(self.smtp_workers, len(recipients))
+        shards = [recipients[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sent = sum(pool.map(lambda shard: self._send_shard(shard, template), shards))
+        logging.info(f"Broadcast delivered to {sent}/{len(recipients)} subscribers.")
 
     def send_welcome_email_with_current_tickets(self, email, name, tickets):
         subject = f"🎸 Welcome! {len(tickets)} Oasis Tickets Currently Available!"
@@ -134,166 +462,347 @@ class TwicketsMonitor:
 
     def remove_subscriber(self, email):
         email = email.lower().strip()
-        original_count = len(self.subscribers)
-        self.subscribers = [s for s in self.subscribers if s['email'] != email]
-        self.save_subscribers()
-        return len(self.subscribers) < original_count
+        with self._subscribers_lock:
+            if self.subscribers.pop(email, None) is None:
+                return False
+            self._log_subscriber_change({'op': 'remove', 'email': email})
+        return True
 
-    def update_status(self, status_data):
+    def update_status(self, status_data, flush=True):
+        """Publishes status in memory for this process's UI; only touches disk when flush is set."""
+        self._status = status_data
+        if not flush: return
         try:
-            with open(STATUS_FILE, 'w') as f: json.dump(status_data, f, indent=2)
+            buf = orjson.dumps(status_data)
+            if buf == self._last_status_bytes: return
+            atomic_write(STATUS_FILE, buf)
+            self._last_status_bytes = buf
         except Exception as e:
             logging.error(f"Error updating status: {e}")
 
-    def check_tickets(self, driver, is_one_off_check=False):
+    def _scrape_current_tickets(self, driver):
+        """Loads the event page; returns (its tickets, whether every listing had rendered). known_tickets is untouched."""
+        driver.get(self.url)
         try:
-            driver.get(self.url)
-            time.sleep(3)
-            try:
-                if 'display: none' not in driver.find_element(By.ID, 'no-listings-found').get_attribute('style'):
-                    if not is_one_off_check: self.known_tickets = set()
-                    return []
-            except NoSuchElementException:
-                pass
-            
-            current_tickets = []
-            for listing in driver.find_elements(By.XPATH, "//ul[@id='list']//twickets-listing"):
-                try:
-                    details_text = listing.find_element(By.XPATH, ".//span[starts-with(@id, 'listingSeatDetails')]").text.strip()
-                    summary_text = listing.find_element(By.XPATH, ".//span[starts-with(@id, 'listingTicketSummary')]").text.strip()
-                    price_match = re.search(r'£\s?[\d,.]+', summary_text)
-                    price = price_match.group(0) if price_match else "N/A"
-                    unique_id = hashlib.md5(details_text.encode()).hexdigest()
-                    current_tickets.append({'id': unique_id, 'text': details_text, 'price': price})
-                except Exception:
+            # Listing elements exist before their spans are filled, so wait until every one has its details.
+            WebDriverWait(driver, PAGE_READY_TIMEOUT).until(lambda d: d.execute_script(LISTINGS_READY_JS))
+        except TimeoutException:
+            logging.warning("Listings did not render in time; reading the page as-is.")
+        page = driver.execute_script(SCRAPE_LISTINGS_JS)
+        current_tickets, complete = [], True
+        # Listings mostly persist between polls, so only newly seen details get hashed.
+        known_ids, seen_ids = self._id_cache, {}
+        if page['banner'] is None or _DISPLAY_NONE_RE.search(page['banner']):
+            for listing in page['listings']:
+                # Only reachable after a timeout; check_tickets then keeps the ids it already knew.
+                if not listing or not listing[0]:
+                    complete = False
                     continue
-            
-            if not current_tickets:
-                if not is_one_off_check: self.known_tickets = set()
-                return []
-            if is_one_off_check:
-                return current_tickets
-            
+                details_text, summary_text = listing
+                uid = known_ids.get(details_text)
+                if uid is None: uid = ticket_id(details_text)
+                seen_ids[details_text] = uid
+                price_match = _PRICE_RE.search(summary_text)
+                price = price_match.group(0) if price_match else "N/A"
+                current_tickets.append({'id': uid, 'text': details_text, 'price': price})
+        with self._scrape_lock:
+            self._last_scrape, self._last_scrape_ts = current_tickets, time.monotonic()
+            self._id_cache = seen_ids
+        return current_tickets, complete
+
+    def recent_tickets(self):
+        """Returns the last scrape if it is younger than the cache TTL, else None."""
+        with self._scrape_lock:
+            if self._last_scrape is not None and time.monotonic() - self._last_scrape_ts < self._scrape_ttl:
+                return list(self._last_scrape)
+        return None
+
+    def submit_job(self, fn, *args):
+        """Queues UI-triggered page/SMTP work onto the monitor's job worker; returns its Future."""
+        return self._jobs.submit(fn, *args)
+
+    def set_baseline(self, tickets):
+        with self._known_lock:
+            self.known_tickets = {t['id'] for t in tickets}
+        return len(self.known_tickets)
+
+    def initialize_baseline(self):
+        # A failed scrape raises here: an empty baseline would re-alert every listing on the page.
+        return self.set_baseline(self.fresh_tickets())
+
+    def fresh_tickets(self):
+        """Tickets on the page right now, reusing a fresh scrape if there is one; raises if the page can't be read. Runs on the job worker."""
+        tickets = self.recent_tickets()
+        if tickets is not None:
+            return tickets
+        try:
+            # The job worker has its own driver, so a one-off check never waits on the monitor's.
+            if not (self._job_driver and self._job_driver.session_id):
+                self._job_driver = create_driver()
+            return self._scrape_current_tickets(self._job_driver)[0]
+        except WebDriverException:
+            quit_quietly(self._job_driver)
+            self._job_driver = None
+            raise
+        finally:
+            self._schedule_job_driver_release()
+
+    def current_tickets(self):
+        """Like fresh_tickets, but logs a failed scrape and returns [] instead."""
+        try:
+            return self.fresh_tickets()
+        except WebDriverException as e:
+            logging.error(f"WebDriver error in one-off check: {e.msg}")
+        except Exception as e:
+            logging.error(f"Error in one-off check: {e}")
+        return []
+
+    def _schedule_job_driver_release(self):
+        """Quits the job driver once it has sat unused for JOB_DRIVER_IDLE_SECONDS."""
+        if self._job_driver is None: return
+        self._job_driver_used_at = time.monotonic()
+        timer = threading.Timer(JOB_DRIVER_IDLE_SECONDS, self._submit_idle_release)
+        timer.daemon = True
+        timer.start()
+
+    def _submit_idle_release(self):
+        # The driver is only touched on the job worker, so the release is queued there rather than run on the timer.
+        try:
+            self.submit_job(self._release_idle_job_driver)
+        except RuntimeError:
+            pass  # close() already shut the worker down and quit the driver
+
+    def _release_idle_job_driver(self):
+        if self._job_driver is None or time.monotonic() - self._job_driver_used_at < JOB_DRIVER_IDLE_SECONDS:
+            return
+        quit_quietly(self._job_driver)
+        self._job_driver = None
+        logging.info("Idle job driver closed.")
+
+    def check_tickets(self, driver):
+        try:
+            current_tickets, complete = self._scrape_current_tickets(driver)
             current_ids = {t['id'] for t in current_tickets}
-            if not self.known_tickets:
-                self.known_tickets = current_ids
-                return []
-            
-            new_ids = current_ids - self.known_tickets
-            if new_ids:
-                self.known_tickets.update(new_ids)
-                return [t for t in current_tickets if t['id'] in new_ids]
-            
-            self.known_tickets = self.known_tickets.intersection(current_ids)
-            return []
+            with self._known_lock:
+                if not current_ids or not self.known_tickets:
+                    self.known_tickets = current_ids
+                    return []
+                new_ids = current_ids - self.known_tickets
+                # Only ids still on the page are remembered, so the set never outgrows the listing. After a partial
+                # scrape the unrendered listings may be known ones, so keep those ids until a complete scrape.
+                self.known_tickets = current_ids if complete else self.known_tickets | current_ids
+            return [t for t in current_tickets if t['id'] in new_ids]
         except WebDriverException as e:
             logging.error(f"WebDriver error in check_tickets: {e.msg}")
-            if not is_one_off_check: self.is_running = False
-            return []
+            raise
         except Exception as e:
             logging.error(f"Error in check_tickets: {e}")
             return []
 
     def broadcast_new_tickets(self, new_tickets, first_dibs_enabled):
-        if first_dibs_enabled and self.admin_email:
+        """Queues the admin's first-dibs email now and the subscriber alert after the delay; returns immediately."""
+        first_dibs = first_dibs_enabled and bool(self.admin_email)
+        if first_dibs:
             subject = f"🔔 FIRST DIBS on {len(new_tickets)} New Oasis Tickets!"
             tickets_info = "\n".join([f"Price: {t.get('price', 'N/A')}, Details: {t.get('text', '')}" for t in new_tickets])
             body = f"Hi Admin,\n\n{len(new_tickets)} new tickets listed.\n\n{tickets_info}\n\nEvent URL: {self.url}\n\nYou have {self.first_dibs_delay} seconds."
-            self.send_email(self.admin_email, subject, body)
-            time.sleep(self.first_dibs_delay)
+            self._queue_broadcast(0, self.send_email, self.admin_email, subject, body)
 
         subject = f"🎸 {len(new_tickets)} New Oasis Tickets Available!"
         tickets_info = "\n".join([f"\nTicket {i+1}:\n  Price: {t.get('price', 'N/A')}\n  Details: {t.get('text', '')[:150]}...\n" for i, t in enumerate(new_tickets)])
         body = f"Hi Oasis Fan!\n\n{len(new_tickets)} NEW tickets are now available!\n\nEvent URL: {self.url}\n\n{tickets_info}\nCheck the page NOW!"
-        
-        recipients = list(self.subscribers)
-        if first_dibs_enabled and self.admin_email:
-            recipients = [s for s in recipients if s['email'].lower() != self.admin_email.lower()]
-        
-        for sub in recipients:
-            self.send_email(sub['email'], subject, body)
+        self._queue_broadcast(self.first_dibs_delay if first_dibs else 0, self._alert_subscribers, subject, body, first_dibs)
+
+    def _alert_subscribers(self, subject, body, exclude_admin):
+        self.refresh_subscribers()
+        self.send_bulk_email(self.broadcast_recipients(exclude_admin=exclude_admin), subject, body)
+
+    def _queue_broadcast(self, delay, fn, *args):
+        """Runs fn on the broadcast worker after delay seconds; stop() cancels it if it hasn't started sending."""
+        def submit():
+            with self._broadcast_lock:
+                # stop() may have cancelled this timer just as it fired.
+                if timer is not None and timer not in self._pending_broadcasts: return
+                self._pending_broadcasts.discard(timer)
+                future = self._broadcasts.submit(fn, *args)
+                self._pending_broadcasts.add(future)
+            future.add_done_callback(self._broadcast_done)
+        if delay <= 0:
+            timer = None
+            submit()
+            return
+        timer = threading.Timer(delay, submit)
+        timer.daemon = True
+        with self._broadcast_lock: self._pending_broadcasts.add(timer)
+        timer.start()
+
+    def _broadcast_done(self, future):
+        with self._broadcast_lock: self._pending_broadcasts.discard(future)
+        if not future.cancelled() and future.exception():
+            logging.error(f"Error broadcasting new tickets: {future.exception()}")
+
+    def cancel_pending_broadcasts(self):
+        """Drops alerts still waiting out a first-dibs delay or queued behind another send; one mid-send finishes."""
+        with self._broadcast_lock:
+            pending, self._pending_broadcasts = self._pending_broadcasts, set()
+        for item in pending: item.cancel()
+        if pending: logging.warning(f"Cancelled {len(pending)} pending alert email(s).")
+
+    def setup_driver(self):
+        self.driver = create_driver()
+        logging.info("Dedicated monitoring driver initialized.")
+        return self.driver
+
+    def _ensure_driver(self):
+        """Returns the warm monitoring driver, rebuilding it only if its session has died."""
+        if self.driver and self.driver.session_id:
+            self.driver.delete_all_cookies()
+            return self.driver
+        return self.setup_driver()
+
+    def _reset_driver(self):
+        if self.driver:
+            try: self.driver.quit()
+            except Exception: pass
+            logging.info("Dedicated monitoring driver shut down.")
+        self.driver = None
+
+    def _check_with_recovery(self):
+        # A dead WebDriver session gets a single rebuild, not a full loop restart.
+        for _ in range(2):
+            try:
+                return self.check_tickets(driver=self._ensure_driver())
+            except WebDriverException:
+                self._reset_driver()
+                if self._stop_event.is_set(): break
+        return []
+
+    def start(self, check_interval, first_dibs_enabled):
+        """Starts monitor_loop on a daemon thread unless one is still alive; returns whether it started."""
+        with self._run_lock:
+            if self._thread and self._thread.is_alive():
+                return False
+            self._stop_event.clear()
+            self.is_running = True
+            self._thread = threading.Thread(target=self.monitor_loop, args=(check_interval, first_dibs_enabled), daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self):
+        self.is_running = False
+        self._stop_event.set()
+        # An alert fired after Stop would reach subscribers early, so pending ones are dropped instead.
+        self.cancel_pending_broadcasts()
+
+    def close(self):
+        """Stops the monitor, lets an in-flight job or send finish, then shuts the workers down and quits the job driver."""
+        self.stop()
+        self._jobs.shutdown(wait=True, cancel_futures=True)
+        self._broadcasts.shutdown(wait=True, cancel_futures=True)
+        quit_quietly(self._job_driver)
+        self._job_driver = None
+        with self._smtp_lock:
+            self._close_smtp()
 
     def monitor_loop(self, check_interval, first_dibs_enabled):
-        total_checks, tickets_found = 0, 0
+        total_checks, tickets_found, next_flush = 0, 0, 0.0
         self.is_running = True
-        driver = None
+        self._scrape_ttl = min(SCRAPE_CACHE_TTL, check_interval / 2)
         try:
-            options = Options()
-            options.add_argument("--disable-gpu"); options.add_argument("--headless")
-            options.add_argument("--no-sandbox"); options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36")
-            service = Service(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install())
-            driver = webdriver.Chrome(service=service, options=options)
-            logging.info("Dedicated monitoring driver initialized.")
-            
-            while self.is_running:
-                new_tickets = self.check_tickets(driver=driver)
+            while not self._stop_event.is_set():
+                deadline = time.monotonic() + check_interval
+                new_tickets = self._check_with_recovery()
                 total_checks += 1
+                # Periodically hand Chrome's renderer memory back to the OS with a fresh session.
+                if total_checks % DRIVER_RECYCLE_CHECKS == 0: self._reset_driver()
                 if new_tickets:
                     tickets_found += len(new_tickets)
                     self.broadcast_new_tickets(new_tickets, first_dibs_enabled)
                 
-                self.update_status({'is_running': True, 'last_check': datetime.now().isoformat(), 'total_checks': total_checks, 'tickets_found': tickets_found})
-                time.sleep(check_interval)
+                # Disk only hears about checks once a minute (or on new tickets), whatever the check interval.
+                flush = bool(new_tickets) or time.monotonic() >= next_flush
+                if flush: next_flush = time.monotonic() + STATUS_FLUSH_SECONDS
+                self.update_status({'is_running': True, 'last_check': datetime.now().isoformat(), 'total_checks': total_checks, 'tickets_found': tickets_found}, flush=flush)
+                if self._stop_event.wait(max(0.0, deadline - time.monotonic())): break
         except Exception as e:
             logging.error(f"FATAL Error in monitor_loop: {e}")
         finally:
-            if driver: driver.quit()
-            logging.info("Dedicated monitoring driver shut down.")
-            self.is_running = False
+            self._reset_driver()
             self.update_status({'is_running': False, 'last_check': datetime.now().isoformat(), 'total_checks': total_checks, 'tickets_found': tickets_found})
-            st.session_state.monitoring_active = False
+            self.is_running = False
+
+@st.cache_resource
+def get_monitor():
+    """Builds the single TwicketsMonitor shared by every session of this server process."""
+    monitor = TwicketsMonitor(
+        url=st.secrets["twickets"]["url"],
+        sender_email=st.secrets["email"]["sender_email"],
+        sender_password=st.secrets["email"]["sender_password"],
+        admin_email=st.secrets.get("admin", {}).get("email"),
+        first_dibs_delay=st.secrets.get("admin", {}).get("first_dibs_delay", 90),
+        smtp_port=st.secrets.get("email", {}).get("smtp_port", 587),
+        smtp_workers=st.secrets.get("email", {}).get("concurrency", 4),
+        bcc_mode=st.secrets.get("email", {}).get("bcc_mode", False)
+    )
+    atexit.register(monitor.close)
+    return monitor
+
+def status_stale_after(monitor, check_interval):
+    """Seconds after which the last check counts as stalled."""
+    # An in-process poller's status is live; one read from the file (e.g. monitor_cli.py's) lags by up to a flush period.
+    if monitor.polls_in_process(): return check_interval * 2
+    return check_interval * 2 + STATUS_FLUSH_SECONDS
+
+def external_poller_active(monitor, check_interval):
+    """True when the status file shows a live poller in another process, e.g. monitor_cli.py."""
+    status = monitor.get_status()
+    if monitor.polls_in_process() or not status.get('is_running') or not status.get('last_check'):
+        return False
+    # A poller killed without a chance to write its final status must not block Start forever.
+    age = (datetime.now() - datetime.fromisoformat(status['last_check'])).total_seconds()
+    return age <= status_stale_after(monitor, check_interval)
 
 def start_monitoring():
-    if not st.session_state.get('monitoring_active', False):
-        st.session_state.monitoring_active = True
-        monitor = st.session_state.monitor
-        check_interval = st.secrets.get("monitoring", {}).get("check_interval", 30)
-        first_dibs = st.session_state.get("first_dibs_enabled", False)
-        
-        thread = threading.Thread(target=monitor.monitor_loop, args=(check_interval, first_dibs))
-        thread.daemon = True
-        thread.start()
+    monitor = get_monitor()
+    check_interval = st.secrets.get("monitoring", {}).get("check_interval", 30)
+    first_dibs = st.session_state.get("first_dibs_enabled", False)
+    if external_poller_active(monitor, check_interval):
+        # A second poller would send every subscriber each alert twice.
+        st.toast("Monitoring is already running in another process (e.g. monitor_cli.py).")
+    elif monitor.start(check_interval, first_dibs):
         st.toast("Monitoring started!")
     else:
         st.toast("Monitoring is already active.")
 
 def stop_monitoring():
-    if st.session_state.get('monitoring_active', False):
-        st.session_state.monitor.is_running = False
-        st.session_state.monitoring_active = False
+    monitor = get_monitor()
+    if monitor.is_running:
+        monitor.stop()
         st.toast("Monitoring stopping...")
+    elif external_poller_active(monitor, st.secrets.get("monitoring", {}).get("check_interval", 30)):
+        st.toast("Monitoring is running in another process (e.g. monitor_cli.py); stop it there.")
     else:
         st.toast("Monitoring is not active.")
 
 def main():
     st.set_page_config(page_title="Oasis Ticket Checker", page_icon="🎸", layout="wide")
 
-    if 'monitor' not in st.session_state:
-        try:
-            st.session_state.monitor = TwicketsMonitor(
-                url=st.secrets["twickets"]["url"],
-                sender_email=st.secrets["email"]["sender_email"],
-                sender_password=st.secrets["email"]["sender_password"],
-                admin_email=st.secrets.get("admin", {}).get("email"),
-                first_dibs_delay=st.secrets.get("admin", {}).get("first_dibs_delay", 90)
-            )
-            status = st.session_state.monitor.get_status()
-            st.session_state.monitoring_active = status.get('is_running', False)
-        except Exception as e:
-            st.error(f"Failed to initialize. Check secrets.toml: {e}"); st.stop()
-    
-    monitor = st.session_state.monitor
+    try:
+        monitor = get_monitor()
+    except Exception as e:
+        st.error(f"Failed to initialize. Check secrets.toml: {e}"); st.stop()
 
     st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/4/44/Oasis_Logo.svg/1600px-Oasis_Logo.svg.png?2023026104117", use_container_width=True)
     st.title("Oasis Ticket Checker")
     
     status = monitor.get_status()
+    # The poller may be this process's thread or a separate monitor_cli.py process sharing the status file.
+    running = monitor.is_running or status.get('is_running', False)
     if status.get('last_check'):
         last_check_dt = datetime.fromisoformat(status['last_check'])
         time_diff_secs = (datetime.now() - last_check_dt).total_seconds()
-        is_stale = time_diff_secs > (st.secrets.get("monitoring", {}).get("check_interval", 30) * 2)
-        if st.session_state.get('monitoring_active', False) and is_stale:
+        is_stale = time_diff_secs > status_stale_after(monitor, st.secrets.get("monitoring", {}).get("check_interval", 30))
+        if running and is_stale:
             status_color, time_ago = "🔴", "stalled"
         else:
             time_ago = f"{int(time_diff_secs)}s ago" if time_diff_secs < 60 else f"{int(time_diff_secs / 60)}m ago"
@@ -315,19 +824,24 @@ def main():
             st.button("🚀 Start Monitoring", on_click=start_monitoring)
             st.button("⏹️ Stop Monitoring", on_click=stop_monitoring)
             
-            if st.button("🔄 Initialize Baseline"):
-                with st.spinner("Checking page..."):
-                    driver = get_driver()
-                    baseline_tickets = monitor.check_tickets(driver=driver, is_one_off_check=True)
-                    monitor.known_tickets = {t['id'] for t in baseline_tickets}
-                st.success(f"✅ Baseline set with {len(monitor.known_tickets)} tickets.")
+            # known_tickets lives in whichever process polls; setting it here would not reach monitor_cli.py.
+            external = external_poller_active(monitor, st.secrets.get("monitoring", {}).get("check_interval", 30))
+            if external:
+                st.caption("The baseline is managed by the monitor running in another process (e.g. monitor_cli.py).")
+            if st.button("🔄 Initialize Baseline", disabled=external):
+                try:
+                    with st.spinner("Checking page..."):
+                        baseline_count = monitor.submit_job(monitor.initialize_baseline).result()
+                    st.success(f"✅ Baseline set with {baseline_count} tickets.")
+                except Exception as e:
+                    st.error(f"Couldn't read the page, so the baseline was left unchanged: {e}")
 
             if st.button("🚪 Logout"):
                 st.session_state.admin_authenticated = False
                 st.rerun()
 
         st.subheader("📊 Status")
-        status_text = "🟢 Active" if st.session_state.get('monitoring_active', False) else "🔴 Stopped"
+        status_text = "🟢 Active" if running else "🔴 Stopped"
         st.metric("Monitoring Status", status_text)
         st.write(f"**Subscribers:** {monitor.get_subscriber_count()}")
 